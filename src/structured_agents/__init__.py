@@ -24,6 +24,7 @@ from structured_agents.events import (
     Observer,
     NullObserver,
     CompositeObserver,
+    QueuedObserver,
     Event,
     KernelEvent,
     KernelStartEvent,
@@ -38,6 +39,7 @@ from structured_agents.kernel import AgentKernel
 from structured_agents.client import (
     LLMClient,
     CompletionResponse,
+    ResponseCache,
     OpenAICompatibleClient,
     LiteLLMClient,
     build_client,
@@ -73,6 +75,7 @@ __all__ = [
     "Observer",
     "NullObserver",
     "CompositeObserver",
+    "QueuedObserver",
     "Event",
     "KernelEvent",
     "KernelStartEvent",
@@ -87,6 +90,7 @@ __all__ = [
     # Client
     "LLMClient",
     "CompletionResponse",
+    "ResponseCache",
     "OpenAICompatibleClient",
     "LiteLLMClient",
     "build_client",
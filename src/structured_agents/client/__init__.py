@@ -3,6 +3,7 @@
 from typing import Any
 
 from structured_agents.client.protocol import CompletionResponse, LLMClient
+from structured_agents.client.cache import ResponseCache
 from structured_agents.client.openai import OpenAICompatibleClient
 from structured_agents.client.litellm_client import LiteLLMClient
 
@@ -57,6 +58,7 @@ def build_client(config: dict[str, Any]) -> LLMClient:
 __all__ = [
     "CompletionResponse",
     "LLMClient",
+    "ResponseCache",
     "OpenAICompatibleClient",
     "LiteLLMClient",
     "build_client",
@@ -0,0 +1,75 @@
+"""Exact-match cache for LLM completion responses."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+from structured_agents.client.protocol import CompletionResponse
+
+
+class ResponseCache:
+    """LRU cache of completion responses keyed by the full request payload.
+
+    Entries expire ``ttl`` seconds after they are stored. Only completed
+    (``finish_reason == "stop"``) responses without tool calls are stored:
+    replaying a tool call would re-run tools against stale context, and a
+    truncated reply would be pinned for the full TTL.
+    """
+
+    __slots__ = ("_entries", "maxsize", "ttl")
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, CompletionResponse]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int,
+        extra_body: dict[str, Any] | None,
+    ) -> bytes:
+        """Hash a request into a cache key."""
+        payload = orjson.dumps(
+            [model, messages, tools, temperature, max_tokens, extra_body],
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).digest()
+
+    def get(self, key: bytes) -> CompletionResponse | None:
+        """Return the cached response for ``key``, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: bytes, response: CompletionResponse) -> None:
+        """Store ``response`` if it is a completed, tool-call-free answer."""
+        if response.tool_calls or response.finish_reason != "stop":
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
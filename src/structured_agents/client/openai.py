@@ -97,13 +97,3 @@ class OpenAICompatibleClient:
 
     async def close(self) -> None:
         await self._client.close()
-
-
-def build_client(config: dict[str, Any]) -> OpenAICompatibleClient:
-    """Build an LLM client from config dict."""
-    return OpenAICompatibleClient(
-        base_url=config.get("base_url", "http://localhost:8000/v1"),
-        api_key=config.get("api_key", "EMPTY"),
-        model=config.get("model", "default"),
-        timeout=config.get("timeout", 120.0),
-    )
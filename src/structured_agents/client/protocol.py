@@ -8,7 +8,7 @@ from typing import Any, Protocol
 from structured_agents.types import TokenUsage
 
 
-@dataclass
+@dataclass(slots=True)
 class CompletionResponse:
     """Response from an LLM completion request."""
 
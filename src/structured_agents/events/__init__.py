@@ -11,7 +11,12 @@ from structured_agents.events.types import (
     ToolResultEvent,
     TurnCompleteEvent,
 )
-from structured_agents.events.observer import Observer, NullObserver, CompositeObserver
+from structured_agents.events.observer import (
+    Observer,
+    NullObserver,
+    CompositeObserver,
+    QueuedObserver,
+)
 
 __all__ = [
     "Event",
@@ -26,4 +31,5 @@ __all__ = [
     "Observer",
     "NullObserver",
     "CompositeObserver",
+    "QueuedObserver",
 ]
@@ -1,12 +1,20 @@
 """Observer protocol and implementations."""
 
 from __future__ import annotations
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Protocol
 from structured_agents.events.types import Event
 
 
 class Observer(Protocol):
-    """Receives agent lifecycle events with single emit method."""
+    """Receives agent lifecycle events with single emit method.
+
+    Observers may also define ``async def emit_many(self, events)``; the
+    kernel then delivers each turn's tool and turn-complete events in one
+    call instead of one ``emit`` per event. A CompositeObserver batches only
+    when every child does, so live children still see events as they happen.
+    """
 
     async def emit(self, event: Event) -> None: ...
 
@@ -14,16 +22,102 @@ class Observer(Protocol):
 class NullObserver:
     """No-op observer that discards all events."""
 
+    __slots__ = ()
+
     async def emit(self, event: Event) -> None:
         pass
 
 
+async def _emit_all(observer: Observer, events: list[Event]) -> None:
+    """Deliver a batch via ``emit_many`` when supported, else one by one."""
+    emit_many = getattr(observer, "emit_many", None)
+    if emit_many is not None:
+        await emit_many(events)
+    else:
+        for event in events:
+            await observer.emit(event)
+
+
 class CompositeObserver:
     """Fan out events to multiple observers."""
 
+    __slots__ = ("_observers",)
+
     def __init__(self, observers: list[Observer]) -> None:
         self._observers = observers
 
     async def emit(self, event: Event) -> None:
-        for observer in self._observers:
-            await observer.emit(event)
+        # Observers are independent (often I/O bound), so deliver concurrently.
+        await asyncio.gather(*(observer.emit(event) for observer in self._observers))
+
+    async def emit_many(self, events: list[Event]) -> None:
+        # One gather per batch; each child still sees the events in order.
+        await asyncio.gather(
+            *(_emit_all(observer, events) for observer in self._observers)
+        )
+
+
+def _batch_emitter(
+    observer: Observer,
+) -> Callable[[list[Event]], Awaitable[None]] | None:
+    """Return ``observer.emit_many`` if it should receive whole-turn batches."""
+    if isinstance(observer, CompositeObserver) and not all(
+        _batch_emitter(child) is not None for child in observer._observers
+    ):
+        return None
+    return getattr(observer, "emit_many", None)
+
+
+class QueuedObserver:
+    """Deliver events to an observer from a background task.
+
+    ``emit`` only enqueues, so a slow observer (network log sink, tracer)
+    never blocks the agent loop. Call ``aclose()`` once the agent is done to
+    flush pending events; it re-raises the first error the observer raised.
+    """
+
+    __slots__ = ("_error", "_observer", "_queue", "_worker")
+
+    def __init__(self, observer: Observer) -> None:
+        self._observer = observer
+        self._queue: asyncio.Queue[Event | None] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+        self._error: BaseException | None = None
+
+    async def emit(self, event: Event) -> None:
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._drain())
+        self._queue.put_nowait(event)
+
+    async def emit_many(self, events: list[Event]) -> None:
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._drain())
+        for event in events:
+            self._queue.put_nowait(event)
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been delivered."""
+        await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Deliver pending events and stop the background worker."""
+        if self._worker is not None:
+            self._queue.put_nowait(None)
+            await self._worker
+            self._worker = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    async def _drain(self) -> None:
+        while True:
+            event = await self._queue.get()
+            try:
+                if event is None:
+                    return
+                await self._observer.emit(event)
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._queue.task_done()
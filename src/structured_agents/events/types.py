@@ -50,6 +50,7 @@ class ModelResponseEvent(KernelEvent):
     content: str | None
     tool_calls_count: int
     usage: TokenUsage | None
+    cache_hit: bool = False
 
 
 class ToolCallEvent(KernelEvent):
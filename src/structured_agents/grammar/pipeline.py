@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 
 from structured_agents.grammar.config import DecodingConstraint
 from structured_agents.grammar.models import StructuredOutputModel
 from structured_agents.types import ToolSchema
 
+# Every tool shares the same trigger prefix and closing tag, so they are
+# emitted once instead of being rebuilt (and de-duplicated) per tool.
+_FUNCTION_TRIGGER = "<function="
+_FUNCTION_END_TAG = "</function>"
+
 
 class ConstraintPipeline:
     """Transforms tool schemas plus decoding configuration into vLLM constraints."""
 
+    __slots__ = ("_config",)
+
     def __init__(self, config: DecodingConstraint):
         self._config = config
 
@@ -36,28 +44,19 @@ def build_structural_tag_constraint(
     if not tools:
         return None
 
-    structures: list[dict[str, Any]] = []
-    triggers: set[str] = set()
-
-    for tool in tools:
-        begin_tag = f"<function={tool.name}>"
-        trigger = "<function="
-        triggers.add(trigger)
-
-        args_schema: dict[str, Any] = tool.parameters
-
-        structures.append(
-            {
-                "begin": begin_tag,
-                "schema": args_schema,
-                "end": "</function>",
-            }
-        )
+    structures: list[dict[str, Any]] = [
+        {
+            "begin": f"{_FUNCTION_TRIGGER}{tool.name}>",
+            "schema": tool.parameters,
+            "end": _FUNCTION_END_TAG,
+        }
+        for tool in tools
+    ]
 
     legacy_payload = {
         "type": "structural_tag",
         "structures": structures,
-        "triggers": sorted(triggers),
+        "triggers": [_FUNCTION_TRIGGER],
     }
 
     return {"structured_outputs": {"structural_tag": json.dumps(legacy_payload)}}
@@ -75,10 +74,19 @@ def build_json_schema_constraint(config: DecodingConstraint) -> dict[str, Any] |
     if not issubclass(schema_model, StructuredOutputModel):
         raise TypeError("schema_model must inherit from StructuredOutputModel")
 
+    return {"structured_outputs": {"json": _json_schema_for(schema_model)}}
+
+
+@lru_cache(maxsize=128)
+def _json_schema_for(schema_model: type[StructuredOutputModel]) -> dict[str, Any]:
+    """Generate and validate a model's JSON schema once per process.
+
+    Schema generation is deterministic per model class, so every pipeline and
+    kernel using the same model shares one result. Callers must not mutate it.
+    """
     schema = schema_model.model_json_schema()
     _validate_json_schema(schema)
-
-    return {"structured_outputs": {"json": schema}}
+    return schema
 
 
 def _validate_json_schema(schema: dict[str, Any]) -> None:
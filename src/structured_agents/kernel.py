@@ -3,11 +3,14 @@
 from __future__ import annotations
 import asyncio
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Sequence
+from itertools import chain
+from typing import Any, Iterable, Sequence
 
+from structured_agents.client.cache import ResponseCache
 from structured_agents.client.protocol import CompletionResponse, LLMClient
-from structured_agents.events.observer import NullObserver, Observer
+from structured_agents.events.observer import NullObserver, Observer, _batch_emitter
 from structured_agents.events.types import (
     Event,
     KernelStartEvent,
@@ -37,17 +40,37 @@ from structured_agents.types import (
 _GRAMMAR_SUPPORTED_PREFIXES = ("hosted_vllm/",)
 
 
+# Upper bound on distinct tool selections whose request payloads are cached
+_PREPARED_TOOLS_CACHE_SIZE = 32
+
+
 def _supports_grammar_constraints(model: str) -> bool:
     """Check if a model supports grammar constraints via extra_body."""
-    return any(model.startswith(prefix) for prefix in _GRAMMAR_SUPPORTED_PREFIXES)
+    return model.startswith(_GRAMMAR_SUPPORTED_PREFIXES)
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedTools:
+    """Resolved schemas for a tool selection plus their request payloads."""
+
+    schemas: list[ToolSchema]
+    formatted: list[dict[str, Any]] | None
+    extra_body: dict[str, Any] | None
+
 
+# Shared result for tool-less turns (plain chat), which need no resolution
+_NO_TOOLS = _PreparedTools(schemas=[], formatted=None, extra_body=None)
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentKernel:
     """The core agent loop orchestrator.
 
     The kernel runs a step loop: call LLM -> parse response -> execute tools -> repeat.
 
+    Tool schemas and the constraint pipeline are snapshotted at construction;
+    call ``clear_tool_cache()`` after replacing or mutating either.
+
     Args:
         client: LLM client for making completion requests
         response_parser: Parser for extracting tool calls from model output
@@ -59,6 +82,7 @@ class AgentKernel:
         max_tokens: Maximum tokens per completion
         temperature: Sampling temperature
         tool_choice: Tool choice strategy
+        response_cache: Optional cache of tool-call-free completion responses
     """
 
     client: LLMClient
@@ -71,119 +95,277 @@ class AgentKernel:
     max_tokens: int = 4096
     temperature: float = 0.1
     tool_choice: str = "auto"
+    response_cache: ResponseCache | None = None
+
+    # Derived state, filled in by __post_init__
+    _tool_map: dict[str, Tool] = field(init=False, repr=False, compare=False)
+    _schema_map: dict[str, ToolSchema] = field(init=False, repr=False, compare=False)
+    _prepared_tools: dict[tuple[str | int, ...], _PreparedTools] = field(
+        init=False, repr=False, compare=False
+    )
+    _observed: bool = field(init=False, repr=False, compare=False)
+    _constrained: bool = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self._tool_map: dict[str, Tool] = {t.schema.name: t for t in self.tools}
+        self._index_tools()
+        self._prepared_tools = {}
+        self._check_observer()
+
+    def _check_observer(self) -> None:
+        """Note whether events need building; the observer may be reassigned."""
+        # Only a plain NullObserver is skipped; subclasses may override emit
+        self._observed = type(self.observer) is not NullObserver
+
+    def _index_tools(self) -> None:
+        """Snapshot each tool, its current schema, and the constraint setup."""
+        self._tool_map = {}
+        self._schema_map = {}
+        for t in self.tools:
+            schema = t.schema
+            self._tool_map[schema.name] = t
+            self._schema_map[schema.name] = schema
+        # Grammar constraints apply only to supported providers (vLLM)
+        self._constrained = self.constraint_pipeline is not None and (
+            _supports_grammar_constraints(self.client.model)
+        )
+
+    def clear_tool_cache(self) -> None:
+        """Re-read tool schemas and the constraint pipeline, dropping old payloads."""
+        self._index_tools()
+        self._prepared_tools.clear()
+
+    def _prepare_tools(
+        self, tools: Sequence[ToolSchema] | Sequence[str]
+    ) -> _PreparedTools:
+        """Resolve tools and build their API payloads, reusing earlier results.
+
+        The tool list and grammar constraint are pure functions of the selected
+        tools, so they are computed once per selection (keyed by tool name or
+        schema identity) instead of on every turn.
+        """
+        if not tools:
+            return _NO_TOOLS
+        key = tuple(t if isinstance(t, str) else id(t) for t in tools)
+        prepared = self._prepared_tools.get(key)
+        if prepared is not None:
+            return prepared
 
-    async def step(
-        self,
-        messages: list[Message],
-        tools: Sequence[ToolSchema] | Sequence[str],
-        turn: int = 0,
-    ) -> StepResult:
-        """Execute a single turn: model call + tool execution."""
         resolved_tools: list[ToolSchema] = []
+        schema_map = self._schema_map
         for t in tools:
-            if isinstance(t, ToolSchema):
+            if isinstance(t, str):
+                schema = schema_map.get(t)
+                if schema is not None:
+                    resolved_tools.append(schema)
+            elif isinstance(t, ToolSchema):
                 resolved_tools.append(t)
-            elif isinstance(t, str):
-                tool = self._tool_map.get(t)
-                if tool:
-                    resolved_tools.append(tool.schema)
 
-        # Format messages and tools for API
-        formatted_messages = [msg.to_openai_format() for msg in messages]
         formatted_tools = (
-            [ts.to_openai_format() for ts in resolved_tools] if resolved_tools else None
+            list(map(ToolSchema.to_openai_format, resolved_tools))
+            if resolved_tools
+            else None
         )
 
-        # Apply grammar constraints only for supported providers
         extra_body = None
-        if self.constraint_pipeline and _supports_grammar_constraints(
-            self.client.model
-        ):
-            extra_body = self.constraint_pipeline.constrain(resolved_tools)
+        pipeline = self.constraint_pipeline
+        if resolved_tools and self._constrained and pipeline is not None:
+            extra_body = pipeline.constrain(resolved_tools)
+
+        # Cached schemas keep the keyed objects alive, so their ids stay unique.
+        prepared = _PreparedTools(
+            schemas=resolved_tools, formatted=formatted_tools, extra_body=extra_body
+        )
+        if len(self._prepared_tools) >= _PREPARED_TOOLS_CACHE_SIZE:
+            del self._prepared_tools[next(iter(self._prepared_tools))]
+        self._prepared_tools[key] = prepared
+        return prepared
+
+    async def step(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolSchema] | Sequence[str],
+        turn: int = 0,
+    ) -> StepResult:
+        """Execute a single turn: model call + tool execution."""
+        self._check_observer()
+        return await self._step(messages, self._prepare_tools(tools), turn)
 
-        request_start = time.perf_counter()
+    async def _step(
+        self, messages: Iterable[Message], prepared: _PreparedTools, turn: int
+    ) -> StepResult:
+        """Execute a single turn against already-resolved tools."""
+        resolved_tools = prepared.schemas
+
+        # Format messages for API (each Message memoizes its own dict)
+        formatted_messages = list(map(Message.to_openai_format, messages))
+        formatted_tools = prepared.formatted
+        extra_body = prepared.extra_body
+
+        observed = self._observed
+        # Timings only feed events, so unobserved kernels skip the clock reads
+        request_start = time.perf_counter_ns() if observed else 0
+        cache = self.response_cache
+        if cache is not None:
+            cache_key = cache.make_key(
+                self.client.model,
+                formatted_messages,
+                formatted_tools,
+                self.temperature,
+                self.max_tokens,
+                extra_body,
+            )
         try:
-            await self.observer.emit(
-                ModelRequestEvent(
-                    turn=turn,
-                    messages_count=len(formatted_messages),
-                    tools_count=len(resolved_tools),
-                    model=self.client.model,
+            if observed:
+                await self.observer.emit(
+                    ModelRequestEvent(
+                        turn=turn,
+                        messages_count=len(formatted_messages),
+                        tools_count=len(resolved_tools),
+                        model=self.client.model,
+                    )
                 )
-            )
 
-            response = await self.client.chat_completion(
-                messages=formatted_messages,
-                tools=formatted_tools,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                extra_body=extra_body,
-            )
+            response = cache.get(cache_key) if cache is not None else None
+            cache_hit = response is not None
+
+            if response is None:
+                response = await self.client.chat_completion(
+                    messages=formatted_messages,
+                    tools=formatted_tools,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    extra_body=extra_body,
+                )
         except Exception as e:
             raise KernelError(f"API call failed: {e}", turn=turn, phase="model_request")
 
-        request_duration_ms = int((time.perf_counter() - request_start) * 1000)
-
-        await self.observer.emit(
-            ModelResponseEvent(
-                turn=turn,
-                duration_ms=request_duration_ms,
-                content=response.content,
-                tool_calls_count=len(response.tool_calls) if response.tool_calls else 0,
-                usage=response.usage,
+        if observed:
+            request_duration_ms = (time.perf_counter_ns() - request_start) // 1_000_000
+            await self.observer.emit(
+                ModelResponseEvent(
+                    turn=turn,
+                    duration_ms=request_duration_ms,
+                    content=response.content,
+                    tool_calls_count=(
+                        len(response.tool_calls) if response.tool_calls else 0
+                    ),
+                    usage=None if cache_hit else response.usage,
+                    cache_hit=cache_hit,
+                )
             )
-        )
 
         content, tool_calls = self.response_parser.parse(
             response.content, response.tool_calls
         )
 
+        # Only tool-free answers are stored: the parser also finds tool calls
+        # in content, and replaying one would re-run its tools unprompted.
+        if cache is not None and not cache_hit and not tool_calls:
+            cache.put(cache_key, response)
+
         response_message = Message(
             role="assistant",
             content=content,
             tool_calls=tool_calls if tool_calls else None,
         )
 
-        tool_results = []
-        errors_count = 0
+        tool_results: list[ToolResult] = []
 
-        async def execute_one(tc: ToolCall) -> ToolResult:
-            nonlocal errors_count
-            await self.observer.emit(
+        # Observers with emit_many get this turn's remaining events in one call
+        emit_many = _batch_emitter(self.observer) if observed else None
+        batch: list[Event] | None = [] if emit_many is not None else None
+
+        if tool_calls:
+            if self.max_concurrency <= 1 or len(tool_calls) == 1:
+                # A lone call (the common case) skips task and gather overhead
+                tool_results = [
+                    await self._execute_tool(tc, turn, batch) for tc in tool_calls
+                ]
+            elif len(tool_calls) <= self.max_concurrency:
+                # Every call fits under the limit, so no semaphore is needed
+                tool_results = list(
+                    await asyncio.gather(
+                        *[self._execute_tool(tc, turn, batch) for tc in tool_calls]
+                    )
+                )
+            else:
+                # More calls than slots: a fixed pool of workers pulls calls in
+                # order, instead of a semaphore acquire/release per call.
+                results: list[ToolResult | None] = [None] * len(tool_calls)
+                pending = iter(enumerate(tool_calls))
+
+                async def worker() -> None:
+                    for index, tc in pending:
+                        results[index] = await self._execute_tool(tc, turn, batch)
+
+                await asyncio.gather(*[worker() for _ in range(self.max_concurrency)])
+                tool_results = [result for result in results if result is not None]
+
+        if observed:
+            await self._emit(
+                TurnCompleteEvent(
+                    turn=turn,
+                    tool_calls_count=len(tool_calls) if tool_calls else 0,
+                    tool_results_count=len(tool_results),
+                    errors_count=sum(result.is_error for result in tool_results),
+                ),
+                batch,
+            )
+            if emit_many is not None and batch is not None:
+                await emit_many(batch)
+
+        return StepResult(
+            response_message=response_message,
+            tool_calls=tool_calls,
+            tool_results=tool_results,
+            # A replayed response spent no tokens this turn
+            usage=None if cache_hit else response.usage,
+        )
+
+    async def _emit(self, event: Event, batch: list[Event] | None) -> None:
+        """Emit an event now, or append it to the turn's batch if one is open."""
+        if batch is None:
+            await self.observer.emit(event)
+        else:
+            batch.append(event)
+
+    async def _execute_tool(
+        self, tc: ToolCall, turn: int, batch: list[Event] | None = None
+    ) -> ToolResult:
+        """Run one tool call, emitting its call and result events."""
+        if self._observed:
+            await self._emit(
                 ToolCallEvent(
                     turn=turn,
                     tool_name=tc.name,
                     call_id=tc.id,
                     arguments=tc.arguments,
-                )
+                ),
+                batch,
+            )
+        tool_start = time.perf_counter_ns() if self._observed else 0
+        tool = self._tool_map.get(tc.name)
+        if not tool:
+            result = ToolResult(
+                call_id=tc.id,
+                name=tc.name,
+                output=f"Unknown tool: {tc.name}",
+                is_error=True,
+            )
+            return result
+        try:
+            result = await tool.execute(tc.arguments, tc)
+        except Exception as e:
+            result = ToolResult(
+                call_id=tc.id,
+                name=tc.name,
+                output=str(e),
+                is_error=True,
             )
-            tool_start = time.perf_counter()
-            tool = self._tool_map.get(tc.name)
-            if not tool:
-                result = ToolResult(
-                    call_id=tc.id,
-                    name=tc.name,
-                    output=f"Unknown tool: {tc.name}",
-                    is_error=True,
-                )
-                errors_count += 1
-                return result
-            try:
-                result = await tool.execute(tc.arguments, tc)
-            except Exception as e:
-                result = ToolResult(
-                    call_id=tc.id,
-                    name=tc.name,
-                    output=str(e),
-                    is_error=True,
-                )
-                errors_count += 1
 
-            duration_ms = int((time.perf_counter() - tool_start) * 1000)
-            await self.observer.emit(
+        if self._observed:
+            duration_ms = (time.perf_counter_ns() - tool_start) // 1_000_000
+            await self._emit(
                 ToolResultEvent(
                     turn=turn,
                     tool_name=tc.name,
@@ -191,39 +373,10 @@ class AgentKernel:
                     is_error=result.is_error,
                     duration_ms=duration_ms,
                     output_preview=result.output[:100] if result.output else "",
-                )
-            )
-            return result
-
-        if tool_calls:
-            if self.max_concurrency <= 1:
-                tool_results = [await execute_one(tc) for tc in tool_calls]
-            else:
-                sem = asyncio.Semaphore(self.max_concurrency)
-
-                async def bounded(tc: ToolCall) -> ToolResult:
-                    async with sem:
-                        return await execute_one(tc)
-
-                tool_results = list(
-                    await asyncio.gather(*[bounded(tc) for tc in tool_calls])
-                )
-
-        await self.observer.emit(
-            TurnCompleteEvent(
-                turn=turn,
-                tool_calls_count=len(tool_calls) if tool_calls else 0,
-                tool_results_count=len(tool_results),
-                errors_count=errors_count,
+                ),
+                batch,
             )
-        )
-
-        return StepResult(
-            response_message=response_message,
-            tool_calls=list(tool_calls) if tool_calls else [],
-            tool_results=tool_results,
-            usage=response.usage,
-        )
+        return result
 
     async def run(
         self,
@@ -232,46 +385,65 @@ class AgentKernel:
         max_turns: int = 20,
     ) -> RunResult:
         """Execute the full agent loop."""
-        messages = list(initial_messages)
+        # The first message stays pinned; the rest live in a bounded window
+        # whose appends evict the oldest entry, so no per-turn trimming. The
+        # window always keeps at least one slot for the latest response.
+        pinned = initial_messages[:1]
+        window: deque[Message] = deque(
+            initial_messages[1:] if pinned else initial_messages,
+            maxlen=max(self.max_history_messages - len(pinned), 1),
+        )
         turn_count = 0
         termination_reason = "max_turns"
+        # Plain int counters; a TokenUsage is built once at the end
+        prompt_tokens = completion_tokens = total_tokens = 0
+        usage_reported = False
 
-        run_start = time.perf_counter()
+        self._check_observer()
+        run_start = time.perf_counter_ns() if self._observed else 0
+        # Resolve once; every turn of the run reuses the same tool payloads
+        prepared = self._prepare_tools(tools)
 
-        await self.observer.emit(
-            KernelStartEvent(
-                max_turns=max_turns,
-                tools_count=len(self.tools),
-                initial_messages_count=len(initial_messages),
+        if self._observed:
+            await self.observer.emit(
+                KernelStartEvent(
+                    max_turns=max_turns,
+                    tools_count=len(self.tools),
+                    initial_messages_count=len(initial_messages),
+                )
             )
-        )
 
         while turn_count < max_turns:
             turn_count += 1
 
-            if len(messages) > self.max_history_messages:
-                messages = [messages[0]] + messages[-(self.max_history_messages - 1) :]
+            step_result = await self._step(chain(pinned, window), prepared, turn_count)
 
-            step_result = await self.step(messages, tools, turn=turn_count)
+            usage = step_result.usage
+            if usage is not None:
+                usage_reported = True
+                prompt_tokens += usage.prompt_tokens
+                completion_tokens += usage.completion_tokens
+                total_tokens += usage.total_tokens
 
-            messages.append(step_result.response_message)
+            window.append(step_result.response_message)
             for result in step_result.tool_results:
-                messages.append(result.to_message())
+                window.append(result.to_message())
 
             if not step_result.tool_calls:
                 termination_reason = "no_tool_calls"
                 break
 
-        run_duration_ms = int((time.perf_counter() - run_start) * 1000)
-
-        await self.observer.emit(
-            KernelEndEvent(
-                turn_count=turn_count,
-                termination_reason=termination_reason,
-                total_duration_ms=run_duration_ms,
+        if self._observed:
+            run_duration_ms = (time.perf_counter_ns() - run_start) // 1_000_000
+            await self.observer.emit(
+                KernelEndEvent(
+                    turn_count=turn_count,
+                    termination_reason=termination_reason,
+                    total_duration_ms=run_duration_ms,
+                )
             )
-        )
 
+        messages = [*pinned, *window]
         final_message = (
             messages[-1] if messages else Message(role="assistant", content="")
         )
@@ -281,6 +453,13 @@ class AgentKernel:
             history=messages,
             turn_count=turn_count,
             termination_reason=termination_reason,
+            total_usage=TokenUsage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=total_tokens,
+            )
+            if usage_reported
+            else None,
         )
 
     async def close(self) -> None:
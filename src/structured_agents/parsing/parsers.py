@@ -1,14 +1,55 @@
 """Response parser implementations."""
 
 from __future__ import annotations
-import json
-import re
+from collections.abc import Iterator
 from typing import Any, Protocol
+
+import orjson
 from structured_agents.types import ToolCall
 
 
+_TOOL_CALL_OPEN = "<tool_call>"
+_TOOL_CALL_CLOSE = "</tool_call>"
+
+
+def _iter_tool_call_bodies(content: str) -> Iterator[str]:
+    """Yield the text inside each ``<tool_call>...</tool_call>`` pair, in order.
+
+    A linear ``str.find`` scan; equivalent to a non-greedy DOTALL regex
+    without the regex engine's per-character backtracking.
+    """
+    find = content.find
+    start = find(_TOOL_CALL_OPEN)
+    while start != -1:
+        body_start = start + len(_TOOL_CALL_OPEN)
+        end = find(_TOOL_CALL_CLOSE, body_start)
+        if end == -1:
+            return
+        yield content[body_start:end]
+        start = find(_TOOL_CALL_OPEN, end + len(_TOOL_CALL_CLOSE))
+
+
+def _load_arguments(raw: str | dict[str, Any] | None) -> dict[str, Any]:
+    """Decode an API tool call's arguments string, falling back to {}."""
+    if isinstance(raw, dict):
+        # Some providers hand back arguments already decoded
+        return raw
+    # Arguments must be a JSON object; anything else (including blank input)
+    # is rejected up front instead of through the decoder's error path
+    if not raw or (raw[0] != "{" and not raw.lstrip().startswith("{")):
+        return {}
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return {}
+
+
 class ResponseParser(Protocol):
-    """Parses model responses to extract tool calls."""
+    """Parses model responses to extract tool calls.
+
+    ``parse`` must return a new list on every call; the kernel hands it to
+    ``StepResult`` without copying.
+    """
 
     def parse(
         self, content: str | None, tool_calls: list[dict[str, Any]] | None
@@ -23,20 +64,25 @@ class DefaultResponseParser:
     - XML-style <tool_call> tags in content (fallback)
     """
 
+    __slots__ = ()
+
     def parse(
         self, content: str | None, tool_calls: list[dict[str, Any]] | None
     ) -> tuple[str | None, list[ToolCall]]:
         if tool_calls:
-            parsed = []
+            parsed: list[ToolCall] = []
+            append = parsed.append
             for tc in tool_calls:
                 if isinstance(tc, dict) and "function" in tc:
                     func = tc["function"]
-                    try:
-                        args = json.loads(func.get("arguments", "{}"))
-                    except json.JSONDecodeError:
-                        args = {}
-                    parsed.append(
-                        ToolCall(id=tc["id"], name=func["name"], arguments=args)
+                    name = func["name"]
+                    args = _load_arguments(func.get("arguments"))
+                    call_id = tc.get("id")
+                    # Some providers omit ids; generate one like the XML path
+                    append(
+                        ToolCall(id=call_id, name=name, arguments=args)
+                        if call_id
+                        else ToolCall.create(name, args)
                     )
             return None, parsed
 
@@ -49,31 +95,52 @@ class DefaultResponseParser:
 
     def _parse_xml_tool_calls(self, content: str) -> list[ToolCall]:
         """Parse XML-style tool calls from content."""
-        pattern = r"<tool_call>(.*?)</tool_call>"
-
-        tool_calls = []
-        matches = re.findall(pattern, content, re.DOTALL)
-
-        for match in matches:
-            inner = match.strip()
+        # Most responses carry no tags; a substring check skips the scan
+        if _TOOL_CALL_OPEN not in content:
+            return []
+
+        tool_calls: list[ToolCall] = []
+        # Module globals and attributes are bound once for the loop
+        loads = orjson.loads
+        decode_error = orjson.JSONDecodeError
+        create = ToolCall.create
+        append = tool_calls.append
+        for body in _iter_tool_call_bodies(content):
+            inner = body.strip()
             try:
-                data = json.loads(inner)
+                data = loads(inner)
                 name = data.get("name", "")
                 args = data.get("arguments", {})
                 if name:
-                    tool_calls.append(ToolCall.create(name, args))
-            except json.JSONDecodeError:
+                    append(create(name, args))
+            except decode_error:
                 pass
 
         return tool_calls
 
 
-# Registry for model-specific parsers
+# Registry for model-specific parsers (keys are stored lowercase)
 _PARSER_REGISTRY: dict[str, type[ResponseParser]] = {
     "qwen": DefaultResponseParser,
     "function_gemma": DefaultResponseParser,
 }
 
+# Parsers are stateless, so one instance per class is shared by all callers
+_PARSER_INSTANCES: dict[type[ResponseParser], ResponseParser] = {}
+
+# Provider routing prefixes stripped before the registry lookup
+_PROVIDER_PREFIXES = frozenset(
+    {
+        "hosted_vllm",
+        "anthropic",
+        "openai",
+        "gemini",
+        "azure",
+        "bedrock",
+        "vertex_ai",
+    }
+)
+
 
 def get_response_parser(model_name: str) -> ResponseParser:
     """Look up the response parser for a model family.
@@ -82,34 +149,19 @@ def get_response_parser(model_name: str) -> ResponseParser:
         model_name: Model family name (e.g., "qwen", "function_gemma")
 
     Returns:
-        A ResponseParser instance for the model family.
+        A shared ResponseParser instance for the model family.
         Defaults to DefaultResponseParser if no specific parser is registered.
     """
     # Strip provider prefix if present (e.g., "hosted_vllm/Qwen/..." -> "Qwen/...")
-    if "/" in model_name:
-        parts = model_name.split("/")
-        # Check for known provider prefixes
-        known_prefixes = {
-            "hosted_vllm",
-            "anthropic",
-            "openai",
-            "gemini",
-            "azure",
-            "bedrock",
-            "vertex_ai",
-        }
-        if parts[0] in known_prefixes:
-            model_name = "/".join(parts[1:])
-
-    # Try exact match first
-    parser_cls = _PARSER_REGISTRY.get(model_name)
-
-    # Try lowercase
-    if parser_cls is None:
-        parser_cls = _PARSER_REGISTRY.get(model_name.lower())
-
-    # Default to DefaultResponseParser
-    if parser_cls is None:
-        parser_cls = DefaultResponseParser
-
-    return parser_cls()
+    provider, sep, rest = model_name.partition("/")
+    if sep and provider in _PROVIDER_PREFIXES:
+        model_name = rest
+
+    # Registry keys are lowercase, so one case-folded lookup covers both the
+    # exact and case-insensitive match; unknown models get the default parser
+    parser_cls = _PARSER_REGISTRY.get(model_name.lower(), DefaultResponseParser)
+
+    parser = _PARSER_INSTANCES.get(parser_cls)
+    if parser is None:
+        parser = _PARSER_INSTANCES[parser_cls] = parser_cls()
+    return parser
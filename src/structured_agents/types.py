@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
-import uuid
-from dataclasses import dataclass
+import secrets
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
+import orjson
+
 
 # =============================================================================
 # Messages
@@ -23,9 +24,19 @@ class Message:
     tool_calls: list[ToolCall] | None = None
     tool_call_id: str | None = None
     name: str | None = None
+    _openai_format: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_openai_format(self) -> dict[str, Any]:
-        """Convert to OpenAI API message format."""
+        """Convert to OpenAI API message format.
+
+        The dict is built once per message and reused on later turns, so
+        callers must not mutate it.
+        """
+        if self._openai_format is not None:
+            return self._openai_format
+
         msg: dict[str, Any] = {"role": self.role}
 
         if self.content is not None:
@@ -50,6 +61,7 @@ class Message:
         if self.name:
             msg["name"] = self.name
 
+        object.__setattr__(self, "_openai_format", msg)
         return msg
 
 
@@ -65,17 +77,26 @@ class ToolCall:
     id: str
     name: str
     arguments: dict[str, Any]
+    _arguments_json: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def arguments_json(self) -> str:
-        """Arguments as JSON string."""
-        return json.dumps(self.arguments)
+        """Arguments as compact JSON string, serialized once per call."""
+        if self._arguments_json is not None:
+            return self._arguments_json
+        arguments_json = orjson.dumps(
+            self.arguments, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+        object.__setattr__(self, "_arguments_json", arguments_json)
+        return arguments_json
 
     @classmethod
     def create(cls, name: str, arguments: dict[str, Any]) -> "ToolCall":
         """Create a ToolCall with auto-generated ID."""
         return cls(
-            id=f"call_{uuid.uuid4().hex[:12]}",
+            id=f"call_{secrets.token_hex(6)}",
             name=name,
             arguments=arguments,
         )
@@ -112,10 +133,15 @@ class ToolSchema:
     name: str
     description: str
     parameters: dict[str, Any]
+    _openai_format: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_openai_format(self) -> dict[str, Any]:
-        """Convert to OpenAI tools array format."""
-        return {
+        """Convert to OpenAI tools array format (built once, do not mutate)."""
+        if self._openai_format is not None:
+            return self._openai_format
+        tool: dict[str, Any] = {
             "type": "function",
             "function": {
                 "name": self.name,
@@ -123,6 +149,8 @@ class ToolSchema:
                 "parameters": self.parameters,
             },
         }
+        object.__setattr__(self, "_openai_format", tool)
+        return tool
 
 
 # =============================================================================
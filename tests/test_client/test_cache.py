@@ -0,0 +1,74 @@
+"""Tests for the completion response cache."""
+
+from unittest.mock import patch
+
+from structured_agents.client.cache import ResponseCache
+from structured_agents.client.protocol import CompletionResponse
+
+
+def _response(
+    content: str, tool_calls=None, finish_reason: str = "stop"
+) -> CompletionResponse:
+    return CompletionResponse(
+        content=content,
+        tool_calls=tool_calls,
+        usage=None,
+        finish_reason=finish_reason,
+        raw_response={},
+    )
+
+
+def _key(content: str) -> bytes:
+    return ResponseCache.make_key(
+        "model", [{"role": "user", "content": content}], None, 0.1, 100, None
+    )
+
+
+def test_key_ignores_dict_ordering() -> None:
+    a = ResponseCache.make_key(
+        "m", [{"role": "user", "content": "x"}], None, 0, 1, None
+    )
+    b = ResponseCache.make_key(
+        "m", [{"content": "x", "role": "user"}], None, 0, 1, None
+    )
+    assert a == b
+    assert a != _key("y")
+
+
+def test_get_returns_stored_response() -> None:
+    cache = ResponseCache()
+    response = _response("hi")
+    cache.put(_key("a"), response)
+    assert cache.get(_key("a")) is response
+    assert cache.get(_key("b")) is None
+
+
+def test_responses_with_tool_calls_are_not_stored() -> None:
+    cache = ResponseCache()
+    cache.put(_key("a"), _response("hi", tool_calls=[{"id": "1"}]))
+    assert len(cache) == 0
+
+
+def test_unfinished_responses_are_not_stored() -> None:
+    cache = ResponseCache()
+    cache.put(_key("a"), _response("partial", finish_reason="length"))
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = ResponseCache(maxsize=2)
+    cache.put(_key("a"), _response("a"))
+    cache.put(_key("b"), _response("b"))
+    cache.get(_key("a"))
+    cache.put(_key("c"), _response("c"))
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) is not None
+
+
+def test_expired_entries_are_dropped() -> None:
+    cache = ResponseCache(ttl=10)
+    with patch("structured_agents.client.cache.time.monotonic", return_value=0.0):
+        cache.put(_key("a"), _response("a"))
+    with patch("structured_agents.client.cache.time.monotonic", return_value=11.0):
+        assert cache.get(_key("a")) is None
+    assert len(cache) == 0
@@ -1,4 +1,6 @@
 # tests/test_events/test_observer.py
+import asyncio
+
 import pytest
 from structured_agents.events.types import (
     Event,
@@ -8,7 +10,13 @@ from structured_agents.events.types import (
     ToolCallEvent,
     ToolResultEvent,
 )
-from structured_agents.events.observer import Observer, NullObserver
+from structured_agents.events.observer import (
+    Observer,
+    NullObserver,
+    CompositeObserver,
+    QueuedObserver,
+    _batch_emitter,
+)
 
 
 @pytest.mark.asyncio
@@ -36,3 +44,124 @@ async def test_observer_pattern_matching():
     )
 
     assert len(received_events) == 2
+
+
+@pytest.mark.asyncio
+async def test_composite_observer_delivers_concurrently():
+    received: list[str] = []
+    both_started = asyncio.Event()
+    started = 0
+
+    class SlowObserver:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        async def emit(self, event: Event) -> None:
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            received.append(self.name)
+
+    observer = CompositeObserver([SlowObserver("a"), SlowObserver("b")])
+    await observer.emit(
+        KernelStartEvent(max_turns=1, tools_count=0, initial_messages_count=1)
+    )
+
+    assert sorted(received) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_composite_observer_emit_many_preserves_order():
+    batched: list[list[Event]] = []
+    single: list[Event] = []
+
+    class BatchingObserver:
+        async def emit(self, event: Event) -> None:
+            raise AssertionError("emit_many should be used")
+
+        async def emit_many(self, events: list[Event]) -> None:
+            batched.append(list(events))
+
+    class PlainObserver:
+        async def emit(self, event: Event) -> None:
+            single.append(event)
+
+    events = [
+        ToolCallEvent(turn=1, tool_name="t", call_id="c1", arguments={}),
+        ToolResultEvent(
+            turn=1,
+            tool_name="t",
+            call_id="c1",
+            is_error=False,
+            duration_ms=0,
+            output_preview="",
+        ),
+    ]
+    observer = CompositeObserver([BatchingObserver(), PlainObserver()])
+    await observer.emit_many(events)
+
+    assert batched == [events]
+    assert single == events
+
+
+def test_composite_observer_batches_only_when_every_child_does():
+    class BatchingObserver:
+        async def emit(self, event: Event) -> None:
+            pass
+
+        async def emit_many(self, events: list[Event]) -> None:
+            pass
+
+    class PlainObserver:
+        async def emit(self, event: Event) -> None:
+            pass
+
+    batching = CompositeObserver([BatchingObserver(), BatchingObserver()])
+    mixed = CompositeObserver([BatchingObserver(), PlainObserver()])
+
+    assert _batch_emitter(batching) is not None
+    assert _batch_emitter(mixed) is None
+    assert _batch_emitter(PlainObserver()) is None
+
+
+@pytest.mark.asyncio
+async def test_queued_observer_delivers_in_background():
+    received: list[Event] = []
+    release = asyncio.Event()
+
+    class BlockingObserver:
+        async def emit(self, event: Event) -> None:
+            await release.wait()
+            received.append(event)
+
+    observer = QueuedObserver(BlockingObserver())
+    first = KernelStartEvent(max_turns=1, tools_count=0, initial_messages_count=1)
+    second = KernelEndEvent(
+        turn_count=1, termination_reason="no_tool_calls", total_duration_ms=0
+    )
+
+    # emit() returns even though the wrapped observer is blocked
+    await observer.emit(first)
+    await observer.emit(second)
+    assert received == []
+
+    release.set()
+    await observer.aclose()
+    assert received == [first, second]
+
+
+@pytest.mark.asyncio
+async def test_queued_observer_reraises_on_close():
+    class FailingObserver:
+        async def emit(self, event: Event) -> None:
+            raise RuntimeError("sink down")
+
+    observer = QueuedObserver(FailingObserver())
+    await observer.emit(
+        KernelStartEvent(max_turns=1, tools_count=0, initial_messages_count=1)
+    )
+
+    with pytest.raises(RuntimeError, match="sink down"):
+        await observer.aclose()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from structured_agents.grammar import DecodingConstraint, StructuredOutputModel
@@ -87,3 +89,45 @@ def test_constraint_pipeline_structural_tag() -> None:
     assert payload is not None
     structured = payload["structured_outputs"]
     assert "structural_tag" in structured
+
+
+def test_structural_tag_payload_shares_single_trigger() -> None:
+    constraint = DecodingConstraint(strategy="structural_tag")
+    tools = [
+        ToolSchema(name="a", description="A", parameters={"type": "object"}),
+        ToolSchema(name="b", description="B", parameters={"type": "object"}),
+    ]
+
+    payload = build_structural_tag_constraint(tools, constraint)
+    assert payload is not None
+    tag = json.loads(payload["structured_outputs"]["structural_tag"])
+    assert tag["triggers"] == ["<function="]
+    assert [s["begin"] for s in tag["structures"]] == ["<function=a>", "<function=b>"]
+    assert all(s["end"] == "</function>" for s in tag["structures"])
+
+
+def test_json_schema_generated_once_per_model() -> None:
+    calls = 0
+
+    class CountingOutput(StructuredOutputModel):
+        value: int
+
+        @classmethod
+        def model_json_schema(cls, *args: object, **kwargs: object) -> dict[str, object]:
+            nonlocal calls
+            calls += 1
+            return super().model_json_schema(*args, **kwargs)
+
+    first = ConstraintPipeline(
+        DecodingConstraint(strategy="json_schema", schema_model=CountingOutput)
+    )
+    second = ConstraintPipeline(
+        DecodingConstraint(strategy="json_schema", schema_model=CountingOutput)
+    )
+    tools = [ToolSchema(name="add", description="Add", parameters={"type": "object"})]
+
+    payload_a = first.constrain(tools)
+    payload_b = second.constrain(tools)
+
+    assert calls == 1
+    assert payload_a == payload_b
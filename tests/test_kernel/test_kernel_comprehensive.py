@@ -1,6 +1,8 @@
 # tests/test_kernel/test_kernel_comprehensive.py
 """Comprehensive tests for AgentKernel."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from structured_agents.kernel import AgentKernel, _supports_grammar_constraints
@@ -8,6 +10,7 @@ from structured_agents.parsing import DefaultResponseParser
 from structured_agents.grammar import ConstraintPipeline, DecodingConstraint
 from structured_agents.tools.protocol import Tool
 from structured_agents.types import ToolSchema, ToolResult, Message, TokenUsage
+from structured_agents.client.cache import ResponseCache
 from structured_agents.client.protocol import CompletionResponse
 from structured_agents.events import (
     NullObserver,
@@ -145,6 +148,228 @@ class TestKernelWithTools:
         assert "Unknown tool" in result.tool_results[0].output
 
 
+class TestKernelConcurrency:
+    """Tests for concurrent tool execution."""
+
+    @staticmethod
+    def _client_with_calls(count: int) -> AsyncMock:
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content=None,
+                tool_calls=[
+                    {
+                        "id": f"call_{i}",
+                        "type": "function",
+                        "function": {"name": "wait", "arguments": "{}"},
+                    }
+                    for i in range(count)
+                ],
+                usage=None,
+                finish_reason="tool_calls",
+                raw_response={},
+            )
+        )
+        mock_client.close = AsyncMock()
+        return mock_client
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("call_count,max_concurrency", [(2, 2), (4, 2), (3, 8)])
+    async def test_tools_run_concurrently_in_call_order(
+        self, call_count, max_concurrency
+    ):
+        """Calls should overlap up to max_concurrency and keep call order."""
+        running = 0
+        peak = 0
+        barrier = asyncio.Event()
+
+        async def execute(arguments, context):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            if peak >= min(call_count, max_concurrency):
+                barrier.set()
+            await asyncio.wait_for(barrier.wait(), timeout=1)
+            running -= 1
+            return ToolResult(call_id=context.id, name="wait", output=context.id)
+
+        mock_tool = MagicMock(spec=Tool)
+        mock_tool.schema = ToolSchema(name="wait", description="Wait", parameters={})
+        mock_tool.execute = execute
+
+        kernel = AgentKernel(
+            client=self._client_with_calls(call_count),
+            response_parser=DefaultResponseParser(),
+            tools=[mock_tool],
+            max_concurrency=max_concurrency,
+        )
+
+        result = await kernel.step([Message(role="user", content="go")], ["wait"])
+
+        assert peak == min(call_count, max_concurrency)
+        assert [r.output for r in result.tool_results] == [
+            f"call_{i}" for i in range(call_count)
+        ]
+
+
+class TestKernelUsage:
+    """Tests for token usage accounting in run()."""
+
+    @pytest.mark.asyncio
+    async def test_run_sums_usage_across_turns(self):
+        """total_usage should be the sum of every turn's usage."""
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            side_effect=[
+                CompletionResponse(
+                    content=None,
+                    tool_calls=[
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "echo", "arguments": "{}"},
+                        }
+                    ],
+                    usage=TokenUsage(
+                        prompt_tokens=10, completion_tokens=5, total_tokens=15
+                    ),
+                    finish_reason="tool_calls",
+                    raw_response={},
+                ),
+                CompletionResponse(
+                    content="Done",
+                    tool_calls=None,
+                    usage=TokenUsage(
+                        prompt_tokens=20, completion_tokens=2, total_tokens=22
+                    ),
+                    finish_reason="stop",
+                    raw_response={},
+                ),
+            ]
+        )
+        mock_client.close = AsyncMock()
+
+        mock_tool = MagicMock(spec=Tool)
+        mock_tool.schema = ToolSchema(name="echo", description="Echo", parameters={})
+        mock_tool.execute = AsyncMock(
+            return_value=ToolResult(call_id="call_1", name="echo", output="ok")
+        )
+
+        kernel = AgentKernel(client=mock_client, tools=[mock_tool])
+        result = await kernel.run(
+            [Message(role="user", content="go")], tools=["echo"], max_turns=3
+        )
+
+        assert result.total_usage == TokenUsage(
+            prompt_tokens=30, completion_tokens=7, total_tokens=37
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_without_usage_reports_none(self, mock_client):
+        """total_usage should stay None when no turn reports usage."""
+        kernel = AgentKernel(client=mock_client)
+        result = await kernel.run([Message(role="user", content="hi")], tools=[])
+
+        assert result.total_usage is None
+
+
+class TestKernelResponseCache:
+    """Tests for the opt-in response cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_is_served_from_cache(self):
+        """An identical request should skip the client and flag the event."""
+        events_received = []
+
+        class CollectingObserver:
+            async def emit(self, event):
+                events_received.append(event)
+
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content="Hello",
+                tool_calls=None,
+                usage=None,
+                finish_reason="stop",
+                raw_response={},
+            )
+        )
+
+        kernel = AgentKernel(
+            client=mock_client,
+            observer=CollectingObserver(),
+            response_cache=ResponseCache(),
+        )
+        messages = [Message(role="user", content="Hi")]
+        first = await kernel.step(messages, tools=[])
+        second = await kernel.step(messages, tools=[])
+
+        assert mock_client.chat_completion.await_count == 1
+        assert second.response_message.content == first.response_message.content
+        hits = [
+            e.cache_hit for e in events_received if isinstance(e, ModelResponseEvent)
+        ]
+        assert hits == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_reports_no_usage(self):
+        """A replayed response should not count toward token usage."""
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content="Hello",
+                tool_calls=None,
+                usage=TokenUsage(prompt_tokens=5, completion_tokens=3, total_tokens=8),
+                finish_reason="stop",
+                raw_response={},
+            )
+        )
+
+        kernel = AgentKernel(client=mock_client, response_cache=ResponseCache())
+        messages = [Message(role="user", content="Hi")]
+        first = await kernel.step(messages, tools=[])
+        second = await kernel.step(messages, tools=[])
+
+        assert first.usage is not None
+        assert second.usage is None
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_in_content_are_not_cached(self):
+        """A tool call parsed from content must not be replayed from cache."""
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content='<tool_call>{"name": "echo", "arguments": {}}</tool_call>',
+                tool_calls=None,
+                usage=None,
+                finish_reason="stop",
+                raw_response={},
+            )
+        )
+
+        mock_tool = MagicMock(spec=Tool)
+        mock_tool.schema = ToolSchema(name="echo", description="Echo", parameters={})
+        mock_tool.execute = AsyncMock(
+            return_value=ToolResult(call_id="call_1", name="echo", output="ok")
+        )
+
+        kernel = AgentKernel(
+            client=mock_client, tools=[mock_tool], response_cache=ResponseCache()
+        )
+        messages = [Message(role="user", content="Hi")]
+        await kernel.step(messages, tools=["echo"])
+        await kernel.step(messages, tools=["echo"])
+
+        assert mock_client.chat_completion.await_count == 2
+        assert len(kernel.response_cache) == 0
+
+
 class TestKernelEventEmission:
     """Tests for kernel event emission."""
 
@@ -226,6 +451,184 @@ class TestKernelEventEmission:
             f"Expected 1 ModelRequestEvent, got {len(model_request_events)}"
         )
 
+    @pytest.mark.asyncio
+    async def test_turn_complete_counts_error_results(self):
+        """errors_count should include unknown tools and tool-reported errors."""
+        events_received = []
+
+        class CollectingObserver:
+            async def emit(self, event):
+                events_received.append(event)
+
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content=None,
+                tool_calls=[
+                    {
+                        "id": f"call_{name}",
+                        "type": "function",
+                        "function": {"name": name, "arguments": "{}"},
+                    }
+                    for name in ("fail", "missing", "ok")
+                ],
+                usage=None,
+                finish_reason="tool_calls",
+                raw_response={},
+            )
+        )
+        mock_client.close = AsyncMock()
+
+        def make_tool(name: str, is_error: bool) -> MagicMock:
+            tool = MagicMock(spec=Tool)
+            tool.schema = ToolSchema(name=name, description=name, parameters={})
+            tool.execute = AsyncMock(
+                return_value=ToolResult(
+                    call_id=f"call_{name}", name=name, output="x", is_error=is_error
+                )
+            )
+            return tool
+
+        kernel = AgentKernel(
+            client=mock_client,
+            tools=[make_tool("fail", True), make_tool("ok", False)],
+            observer=CollectingObserver(),
+        )
+        await kernel.step([Message(role="user", content="go")], ["fail", "ok"])
+
+        turn_complete = events_received[-1]
+        assert isinstance(turn_complete, TurnCompleteEvent)
+        assert turn_complete.tool_results_count == 3
+        assert turn_complete.errors_count == 2
+
+    @pytest.mark.asyncio
+    async def test_null_observer_skips_tool_result_preview(self):
+        """Without an observer the output preview should never be sliced."""
+        sliced = []
+
+        class TrackingStr(str):
+            def __getitem__(self, key):
+                sliced.append(key)
+                return super().__getitem__(key)
+
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content=None,
+                tool_calls=[
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "echo", "arguments": "{}"},
+                    }
+                ],
+                usage=None,
+                finish_reason="tool_calls",
+                raw_response={},
+            )
+        )
+
+        mock_tool = MagicMock(spec=Tool)
+        mock_tool.schema = ToolSchema(name="echo", description="Echo", parameters={})
+        mock_tool.execute = AsyncMock(
+            return_value=ToolResult(
+                call_id="call_1", name="echo", output=TrackingStr("x" * 500)
+            )
+        )
+
+        kernel = AgentKernel(client=mock_client, tools=[mock_tool])
+        result = await kernel.step([Message(role="user", content="go")], ["echo"])
+
+        assert len(result.tool_results[0].output) == 500
+        assert sliced == []
+
+    @pytest.mark.asyncio
+    async def test_null_observer_subclass_and_reassignment_emit(self):
+        """Overriding NullObserver.emit or swapping the observer should emit."""
+        events_received = []
+
+        class CountingObserver(NullObserver):
+            async def emit(self, event):
+                events_received.append(event)
+
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content="Hello",
+                tool_calls=None,
+                usage=None,
+                finish_reason="stop",
+                raw_response={},
+            )
+        )
+        messages = [Message(role="user", content="Hi")]
+
+        kernel = AgentKernel(client=mock_client, observer=CountingObserver())
+        await kernel.step(messages, tools=[])
+        assert len(events_received) == 3
+
+        kernel = AgentKernel(client=mock_client)
+        kernel.observer = CountingObserver()
+        await kernel.step(messages, tools=[])
+        assert len(events_received) == 6
+
+    @pytest.mark.asyncio
+    async def test_batching_observer_receives_turn_events_once(self):
+        """Observers with emit_many should get tool events in one batch."""
+        emitted = []
+        batches = []
+
+        class BatchingObserver:
+            async def emit(self, event):
+                emitted.append(event)
+
+            async def emit_many(self, events):
+                batches.append(list(events))
+
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content=None,
+                tool_calls=[
+                    {
+                        "id": f"call_{i}",
+                        "type": "function",
+                        "function": {"name": "echo", "arguments": "{}"},
+                    }
+                    for i in range(2)
+                ],
+                usage=None,
+                finish_reason="tool_calls",
+                raw_response={},
+            )
+        )
+        mock_client.close = AsyncMock()
+
+        mock_tool = MagicMock(spec=Tool)
+        mock_tool.schema = ToolSchema(name="echo", description="Echo", parameters={})
+        mock_tool.execute = AsyncMock(
+            return_value=ToolResult(call_id="call_0", name="echo", output="ok")
+        )
+
+        kernel = AgentKernel(
+            client=mock_client, tools=[mock_tool], observer=BatchingObserver()
+        )
+        await kernel.step([Message(role="user", content="go")], ["echo"])
+
+        assert [type(e) for e in emitted] == [ModelRequestEvent, ModelResponseEvent]
+        assert len(batches) == 1
+        assert [type(e) for e in batches[0]] == [
+            ToolCallEvent,
+            ToolResultEvent,
+            ToolCallEvent,
+            ToolResultEvent,
+            TurnCompleteEvent,
+        ]
+
 
 class TestKernelWithConstraintPipeline:
     """Tests for kernel with constraint pipeline."""
@@ -308,3 +711,202 @@ class TestKernelWithConstraintPipeline:
         # Verify extra_body is None for non-vLLM providers
         call_kwargs = mock_client.chat_completion.call_args.kwargs
         assert call_kwargs.get("extra_body") is None
+
+    @pytest.mark.asyncio
+    async def test_kernel_reuses_constraint_across_steps(self):
+        """Tool payloads and constraints should be built once per tool selection."""
+        mock_client = AsyncMock()
+        mock_client.model = "hosted_vllm/Qwen/Qwen3-4B"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content="Hello",
+                tool_calls=None,
+                usage=None,
+                finish_reason="stop",
+                raw_response={},
+            )
+        )
+        mock_client.close = AsyncMock()
+
+        pipeline = ConstraintPipeline(DecodingConstraint(strategy="structural_tag"))
+        constrain = MagicMock(wraps=pipeline.constrain)
+        constraint_pipeline = MagicMock(spec=ConstraintPipeline)
+        constraint_pipeline.constrain = constrain
+
+        tool_schema = ToolSchema(
+            name="test",
+            description="Test tool",
+            parameters={"type": "object", "properties": {}},
+        )
+
+        kernel = AgentKernel(
+            client=mock_client,
+            response_parser=DefaultResponseParser(),
+            tools=[],
+            constraint_pipeline=constraint_pipeline,
+        )
+
+        messages = [Message(role="user", content="Hello")]
+        await kernel.step(messages, tools=[tool_schema])
+        first_kwargs = mock_client.chat_completion.call_args.kwargs
+        await kernel.step(messages, tools=[tool_schema])
+        second_kwargs = mock_client.chat_completion.call_args.kwargs
+
+        assert constrain.call_count == 1
+        assert second_kwargs["extra_body"] == first_kwargs["extra_body"]
+        assert second_kwargs["tools"] == first_kwargs["tools"]
+
+        kernel.clear_tool_cache()
+        await kernel.step(messages, tools=[tool_schema])
+        assert constrain.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_tool_cache_rebuilds_constraint_payload(self):
+        """A real pipeline should reflect schema edits after clear_tool_cache."""
+        mock_client = AsyncMock()
+        mock_client.model = "hosted_vllm/Qwen/Qwen3-4B"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content="Hello",
+                tool_calls=None,
+                usage=None,
+                finish_reason="stop",
+                raw_response={},
+            )
+        )
+
+        mock_tool = MagicMock(spec=Tool)
+        mock_tool.schema = ToolSchema(
+            name="add", description="Add", parameters={"type": "object"}
+        )
+        kernel = AgentKernel(
+            client=mock_client,
+            tools=[mock_tool],
+            constraint_pipeline=ConstraintPipeline(
+                DecodingConstraint(strategy="structural_tag")
+            ),
+        )
+
+        before = kernel._prepare_tools(["add"]).extra_body
+        mock_tool.schema.parameters["required"] = ["a"]
+        kernel.clear_tool_cache()
+        after = kernel._prepare_tools(["add"]).extra_body
+
+        assert before is not None and after is not None
+        assert "required" not in before["structured_outputs"]["structural_tag"]
+        assert "required" in after["structured_outputs"]["structural_tag"]
+
+    def test_clear_tool_cache_picks_up_assigned_pipeline(self):
+        """A pipeline assigned after construction applies after clear_tool_cache."""
+        mock_client = AsyncMock()
+        mock_client.model = "hosted_vllm/Qwen/Qwen3-4B"
+
+        mock_tool = MagicMock(spec=Tool)
+        mock_tool.schema = ToolSchema(
+            name="add", description="Add", parameters={"type": "object"}
+        )
+        kernel = AgentKernel(client=mock_client, tools=[mock_tool])
+
+        assert kernel._prepare_tools(["add"]).extra_body is None
+        kernel.constraint_pipeline = ConstraintPipeline(
+            DecodingConstraint(strategy="structural_tag")
+        )
+        kernel.clear_tool_cache()
+        assert kernel._prepare_tools(["add"]).extra_body is not None
+
+    def test_clear_tool_cache_picks_up_swapped_schema(self):
+        """Replacing a tool's schema takes effect after clear_tool_cache."""
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+
+        mock_tool = MagicMock(spec=Tool)
+        mock_tool.schema = ToolSchema(name="add", description="Old", parameters={})
+        kernel = AgentKernel(client=mock_client, tools=[mock_tool])
+
+        before = kernel._prepare_tools(["add"]).formatted
+        mock_tool.schema = ToolSchema(name="add", description="New", parameters={})
+        kernel.clear_tool_cache()
+        after = kernel._prepare_tools(["add"]).formatted
+
+        assert before is not None and after is not None
+        assert before[0]["function"]["description"] == "Old"
+        assert after[0]["function"]["description"] == "New"
+
+
+class TestKernelHistory:
+    """Tests for history trimming in run()."""
+
+    @pytest.mark.asyncio
+    async def test_run_trims_history_keeping_first_message(self):
+        """Requests should never exceed max_history_messages and keep the first message."""
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content=None,
+                tool_calls=[
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "echo", "arguments": "{}"},
+                    }
+                ],
+                usage=None,
+                finish_reason="tool_calls",
+                raw_response={},
+            )
+        )
+        mock_client.close = AsyncMock()
+
+        mock_tool = MagicMock(spec=Tool)
+        mock_tool.schema = ToolSchema(name="echo", description="Echo", parameters={})
+        mock_tool.execute = AsyncMock(
+            return_value=ToolResult(call_id="call_1", name="echo", output="ok")
+        )
+
+        kernel = AgentKernel(
+            client=mock_client,
+            response_parser=DefaultResponseParser(),
+            tools=[mock_tool],
+            max_history_messages=4,
+        )
+
+        initial = [
+            Message(role="system", content="sys"),
+            Message(role="user", content="go"),
+        ]
+        result = await kernel.run(initial, tools=["echo"], max_turns=5)
+
+        for call in mock_client.chat_completion.call_args_list:
+            sent = call.kwargs["messages"]
+            assert len(sent) <= 4
+            assert sent[0] == {"role": "system", "content": "sys"}
+        assert len(initial) == 2
+        assert len(result.history) == 4
+        assert result.history[0].content == "sys"
+
+    @pytest.mark.asyncio
+    async def test_run_keeps_latest_response_with_single_message_history(self):
+        """max_history_messages=1 must still keep the model's reply."""
+        mock_client = AsyncMock()
+        mock_client.model = "test-model"
+        mock_client.chat_completion = AsyncMock(
+            return_value=CompletionResponse(
+                content="done",
+                tool_calls=None,
+                usage=None,
+                finish_reason="stop",
+                raw_response={},
+            )
+        )
+        mock_client.close = AsyncMock()
+
+        kernel = AgentKernel(client=mock_client, max_history_messages=1)
+
+        result = await kernel.run(
+            [Message(role="user", content="go")], tools=[], max_turns=1
+        )
+
+        assert result.final_message.role == "assistant"
+        assert result.final_message.content == "done"
+        assert result.history[0].content == "go"
@@ -84,6 +84,47 @@ class TestDefaultResponseParser:
         assert len(tool_calls) == 1
         assert tool_calls[0].arguments == {}  # Falls back to empty dict
 
+    def test_parse_blank_arguments(self):
+        """Blank or non-object arguments should parse to an empty dict."""
+        parser = DefaultResponseParser()
+        raw_tool_calls = [
+            {
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {"name": "noop", "arguments": arguments},
+            }
+            for i, arguments in enumerate(["", "  \n", None, "[1, 2]", "42"])
+        ]
+        content, tool_calls = parser.parse(None, raw_tool_calls)
+
+        assert [tc.arguments for tc in tool_calls] == [{}, {}, {}, {}, {}]
+
+    def test_parse_predecoded_and_padded_arguments(self):
+        """Dict arguments pass through and leading whitespace is tolerated."""
+        parser = DefaultResponseParser()
+        raw_tool_calls = [
+            {
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {"name": "add", "arguments": arguments},
+            }
+            for i, arguments in enumerate([{"a": 1}, ' \n{"a": 1}'])
+        ]
+        content, tool_calls = parser.parse(None, raw_tool_calls)
+
+        assert [tc.arguments for tc in tool_calls] == [{"a": 1}, {"a": 1}]
+
+    def test_parse_tool_call_without_id(self):
+        """A missing API id should be replaced with a generated one."""
+        parser = DefaultResponseParser()
+        raw_tool_calls = [
+            {"type": "function", "function": {"name": "add", "arguments": "{}"}}
+        ]
+        content, tool_calls = parser.parse(None, raw_tool_calls)
+
+        assert tool_calls[0].name == "add"
+        assert tool_calls[0].id.startswith("call_")
+
 
 class TestGetResponseParser:
     """Tests for get_response_parser factory."""
@@ -107,3 +148,7 @@ class TestGetResponseParser:
         """anthropic/ prefix should be handled."""
         parser = get_response_parser("anthropic/claude-3-opus")
         assert isinstance(parser, DefaultResponseParser)
+
+    def test_reuses_parser_instance(self):
+        """Stateless parsers should be shared rather than rebuilt per lookup."""
+        assert get_response_parser("qwen") is get_response_parser("function_gemma")
@@ -8,7 +8,10 @@ from typing import Any
 
 from hypothesis import given, strategies as st, assume, settings
 
-from structured_agents.parsing.parsers import DefaultResponseParser
+from structured_agents.parsing.parsers import (
+    DefaultResponseParser,
+    _iter_tool_call_bodies,
+)
 from structured_agents.types import Message, ToolCall
 
 
@@ -216,6 +219,17 @@ class TestDefaultResponseParserProperties:
             ids = [tc.id for tc in tool_calls]
             assert len(ids) == len(set(ids)), "Tool call IDs should be unique"
 
+    @given(
+        content=st.lists(
+            st.sampled_from(["<tool_call>", "</tool_call>", "x", "\n", "<", ">"]),
+            max_size=30,
+        ).map("".join)
+    )
+    def test_tag_scanner_matches_regex(self, content: str):
+        """The str.find scanner should extract exactly what the regex would."""
+        pattern = re.compile(r"<tool_call>(.*?)</tool_call>", re.DOTALL)
+        assert list(_iter_tool_call_bodies(content)) == pattern.findall(content)
+
 
 # =============================================================================
 # Edge Cases
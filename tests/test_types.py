@@ -20,6 +20,12 @@ def test_message_to_openai_format():
     assert msg.to_openai_format() == {"role": "user", "content": "Hello"}
 
 
+def test_message_to_openai_format_is_built_once():
+    msg = Message(role="user", content="Hello")
+    assert msg.to_openai_format() is msg.to_openai_format()
+    assert msg == Message(role="user", content="Hello")
+
+
 def test_tool_call_create():
     tc = ToolCall.create("add", {"a": 1, "b": 2})
     assert tc.name == "add"
@@ -30,3 +36,16 @@ def test_tool_call_create():
 def test_tool_result_error_property():
     result = ToolResult(call_id="call_123", name="add", output="error", is_error=True)
     assert result.is_error == True
+
+
+def test_tool_schema_to_openai_format_is_built_once():
+    schema = ToolSchema(name="add", description="Add", parameters={})
+    fmt = schema.to_openai_format()
+    assert fmt["function"]["name"] == "add"
+    assert schema.to_openai_format() is fmt
+
+
+def test_tool_call_arguments_json_is_compact_and_cached():
+    tc = ToolCall(id="call_1", name="add", arguments={"a": 1, "b": "é"})
+    assert tc.arguments_json == '{"a":1,"b":"é"}'
+    assert tc.arguments_json is tc.arguments_json